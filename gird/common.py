@@ -8,7 +8,7 @@ from .object import Phony, TimeTracked
 # Type aliases
 Target = Union[Phony, TimeTracked]
 Dependency = Union[Callable[[], bool], Target]
-SubRecipe = Union[str, Callable[[], Any]]
+SubRecipe = Union[str, tuple[str, ...], Callable[[], Any]]
 
 
 @dataclasses.dataclass(frozen=True)
@@ -16,8 +16,8 @@ class Rule:
     """Gird rule. For documentation of the fields, see the function '.rule.rule'."""
 
     target: Target
-    deps: Optional[tuple[Dependency, ...]] = None
-    recipe: Optional[tuple[SubRecipe, ...]] = None
+    deps: tuple[Dependency, ...] = ()
+    recipe: tuple[SubRecipe, ...] = ()
     help: Optional[str] = None
     parallel: bool = True
     listed: bool = True
@@ -12,7 +12,7 @@ from typing import Callable, Iterable, Optional, Union
 from .common import Rule, Target
 from .girdfile import import_girdfile
 from .object import Phony
-from .rulesorter import RuleSorter
+from .rulesorter import RuleSorter, get_map_target_rule
 from .run import run_rules
 
 
@@ -25,6 +25,7 @@ class RunConfig:
     question: bool = False
     dry_run: bool = False
     output_sync: bool = False
+    concurrent_deps: bool = False
 
 
 @dataclasses.dataclass
@@ -33,6 +34,7 @@ class ListConfig:
 
     question: bool
     all: bool
+    concurrent_deps: bool = False
 
 
 class SubcommandResult(enum.Enum):
@@ -124,6 +126,15 @@ def parse_args_and_init() -> tuple[
         ),
     )
 
+    group_options.add_argument(
+        "--concurrent-deps",
+        action="store_true",
+        help=(
+            "Call the function dependencies of rules concurrently in separate "
+            "threads instead of one after another."
+        ),
+    )
+
     args_init, args_unparsed = parser.parse_known_args()
 
     cwd_original = pathlib.Path.cwd()
@@ -275,11 +286,13 @@ def parse_args_and_init() -> tuple[
             question=args_rest.question,
             dry_run=args_rest.dry_run,
             output_sync=args_init.output_sync,
+            concurrent_deps=args_init.concurrent_deps,
         )
     else:
         config = ListConfig(
             question=args_rest.question,
             all=args_rest.all,
+            concurrent_deps=args_init.concurrent_deps,
         )
 
     return rules, config
@@ -295,7 +308,7 @@ def run_rule(rules: Iterable[Rule], config: RunConfig) -> SubcommandResult:
     config
         Run configuration.
     """
-    rule_sorter = RuleSorter(rules, config.target)
+    rule_sorter = RuleSorter(rules, config.target, config.concurrent_deps)
 
     is_target_outdated = rule_sorter.is_target_outdated()
 
@@ -324,13 +337,21 @@ def list_rules(
     config: ListConfig,
 ) -> SubcommandResult:
     """List rules."""
+    if config.question:
+        # Map the targets to the Rules only once for all the RuleSorters.
+        map_target_rule = get_map_target_rule(rules)
+
     parts = []
     for rule in rules:
         if not rule.listed and not config.all:
             continue
 
         if config.question:
-            rule_sorter = RuleSorter(rules, rule.target)
+            rule_sorter = RuleSorter(
+                map_target_rule,
+                rule.target,
+                config.concurrent_deps,
+            )
 
             if rule_sorter.is_target_outdated() and not isinstance(rule.target, Phony):
                 indent_target = "* "
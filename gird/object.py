@@ -1,4 +1,5 @@
 import datetime
+import errno
 import os
 import pathlib
 from typing import Any, Optional, Protocol
@@ -7,6 +8,8 @@ from typing import Any, Optional, Protocol
 class Object(Protocol):
     """Protocol for objects with an identifier."""
 
+    __slots__ = ()
+
     @property
     def id(self) -> str:
         """Unique identifier of the object."""
@@ -21,6 +24,8 @@ class TimeTracked(Object, Protocol):
     determined by timestamps.
     """
 
+    __slots__ = ()
+
     @property
     def timestamp(self) -> Optional[datetime.datetime]:
         """Timestamp of the object, e.g., time of modification. None if the
@@ -34,6 +39,8 @@ class Phony(Object):
     rule to always be executed when invoked.
     """
 
+    __slots__ = ("_name",)
+
     def __init__(self, name: str):
         self._name = name
 
@@ -42,19 +49,48 @@ class Phony(Object):
         return self._name
 
 
+# Error numbers of os.stat that mean a path doesn't exist, as ignored by
+# pathlib.Path.exists.
+NONEXISTENT_PATH_ERRNOS = frozenset(
+    (errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP, errno.ENAMETOOLONG)
+)
+# Windows errors ERROR_NOT_READY, ERROR_INVALID_NAME &
+# ERROR_CANT_RESOLVE_FILENAME.
+NONEXISTENT_PATH_WINERRORS = frozenset((21, 123, 1921))
+
+
 class TimeTrackedPath(TimeTracked):
+    # Support weak references for sharing instances between Rules.
+    __slots__ = ("_path", "_id", "__weakref__")
+
     def __init__(self, path: pathlib.Path):
         self._path = path
+        self._id: Optional[str] = None
 
     @property
     def id(self) -> str:
-        return os.path.relpath(self._path, pathlib.Path.cwd())
+        # The id is used as a key repeatedly, so compute it only once. It's
+        # relative to the working directory at the time of the first access.
+        if self._id is None:
+            self._id = os.path.relpath(self._path, pathlib.Path.cwd())
+        return self._id
 
     @property
     def timestamp(self) -> Optional[datetime.datetime]:
-        if not self._path.exists():
+        # Use a single stat call instead of checking for existence separately.
+        try:
+            mtime_ns = os.stat(self._path).st_mtime_ns
+        except OSError as e:
+            if (
+                e.errno in NONEXISTENT_PATH_ERRNOS
+                or getattr(e, "winerror", None) in NONEXISTENT_PATH_WINERRORS
+            ):
+                return None
+            raise
+        except ValueError:
+            # E.g., paths with null characters can't exist.
             return None
-        return datetime.datetime.fromtimestamp(self._path.stat().st_mtime_ns / 1e9)
+        return datetime.datetime.fromtimestamp(mtime_ns / 1e9)
 
 
 def is_timetracked(instance: Any):
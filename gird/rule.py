@@ -1,6 +1,8 @@
 """The rule function."""
 import pathlib
-from typing import Iterable, Optional, Union
+import sys
+import weakref
+from typing import Any, Callable, Iterable, Optional, Union, cast
 
 from .common import Dependency, Rule, SubRecipe, Target
 from .girdfile import GIRDFILE_CONTEXT
@@ -9,6 +11,53 @@ from .object import Phony, TimeTrackedPath, is_timetracked
 # Type aliases for the rule function API
 ApiTarget = Union[pathlib.Path, Target]
 ApiDependency = Union[pathlib.Path, Rule, Dependency]
+ApiSubRecipe = Union[SubRecipe, list[str]]
+
+# TimeTrackedPaths by the string representations of their paths. Rules with
+# the same paths as targets or dependencies will share the same instances.
+TIMETRACKED_PATHS: "weakref.WeakValueDictionary[str, TimeTrackedPath]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def get_timetracked_path(path: pathlib.Path) -> TimeTrackedPath:
+    """Get a TimeTrackedPath for a path, reusing an existing instance for an
+    equal path if there is one.
+    """
+    key = str(path)
+    timetracked_path = TIMETRACKED_PATHS.get(key)
+    if timetracked_path is None:
+        timetracked_path = TimeTrackedPath(path)
+        TIMETRACKED_PATHS[key] = timetracked_path
+    return timetracked_path
+
+
+# Functions to cast dependencies of the most common types, by the exact types.
+# Looking these up is faster than going through the isinstance checks.
+DEPENDENCY_CASTS: dict[type, Callable[[Any], Dependency]] = {
+    pathlib.PosixPath: get_timetracked_path,
+    pathlib.WindowsPath: get_timetracked_path,
+    Rule: lambda dep: dep.target,
+    Phony: lambda dep: dep,
+    TimeTrackedPath: lambda dep: dep,
+}
+
+
+def cast_dependency(dep: ApiDependency) -> Dependency:
+    """Cast a dependency given to the rule function into a Dependency. Raise a
+    TypeError if the dependency is of an invalid type.
+    """
+    dependency_cast = DEPENDENCY_CASTS.get(type(dep))
+    if dependency_cast is not None:
+        return dependency_cast(dep)
+
+    if isinstance(dep, Rule):
+        dep = dep.target
+    if isinstance(dep, pathlib.Path):
+        dep = get_timetracked_path(dep)
+    elif not callable(dep) and not is_timetracked(dep) and not isinstance(dep, Phony):
+        raise TypeError(f"Invalid deps type: '{dep}'.")
+    return dep
 
 
 def rule(
@@ -21,8 +70,8 @@ def rule(
     ] = None,
     recipe: Optional[
         Union[
-            SubRecipe,
-            Iterable[SubRecipe],
+            ApiSubRecipe,
+            Iterable[ApiSubRecipe],
         ]
     ] = None,
     help: Optional[str] = None,
@@ -36,9 +85,14 @@ def rule(
     target
         Target of the rule.
     deps
-        Dependencies of the target.
+        Dependencies of the target. Function dependencies are called
+        concurrently with each other in separate threads if the CLI argument
+        '--concurrent-deps' is given.
     recipe
         Recipe to update the target. Strings will be executed as shell commands.
+        Lists of strings within the recipe will be executed as commands without
+        a shell, i.e., as argument lists, which avoids the overhead of starting
+        a shell process.
         Python function recipes need to be picklable if parallel is True. I.e.,
         Lambda functions and locally defined functions require parallel to be
         False.
@@ -182,45 +236,61 @@ def rule(
     >>> ]
     """
     if isinstance(target, pathlib.Path):
-        target = TimeTrackedPath(target)
+        target = get_timetracked_path(target)
     elif not is_timetracked(target) and not isinstance(target, Phony):
         raise TypeError(f"Invalid target type: '{target}'.")
 
+    deps_cast: tuple[Dependency, ...] = ()
     if deps is not None:
-        if not isinstance(deps, Iterable):
-            deps = [deps]
-
-        deps_cast = []
-        for dep in deps:
-            if isinstance(dep, Rule):
-                dep = dep.target
-            if isinstance(dep, pathlib.Path):
-                dep = TimeTrackedPath(dep)
-            elif (
-                not callable(dep)
-                and not is_timetracked(dep)
-                and not isinstance(dep, Phony)
-            ):
-                raise TypeError(f"Invalid deps type: '{dep}'.")
-            deps_cast.append(dep)
-
-        deps = tuple(deps_cast)
-
+        # Check the common types first, as exact type checks are cheaper than
+        # attribute lookups. Avoid isinstance checks against Iterable, which go
+        # through the ABC machinery.
+        deps_type = type(deps)
+        if deps_type is list or deps_type is tuple:
+            deps_iter = cast(Iterable[ApiDependency], deps)
+        elif deps_type in DEPENDENCY_CASTS:
+            # A single dependency of a common type.
+            deps_iter = (cast(ApiDependency, deps),)
+        elif hasattr(deps_type, "__iter__"):
+            deps_iter = cast(Iterable[ApiDependency], deps)
+        else:
+            deps_iter = (cast(ApiDependency, deps),)
+
+        deps_cast = tuple(map(cast_dependency, deps_iter))
+
+    recipe_cast: tuple[SubRecipe, ...] = ()
     if recipe is not None:
-        if not isinstance(recipe, Iterable) or isinstance(recipe, str):
-            recipe = (recipe,)
-
-        # Ensure recipe is not a single-pass Iterator.
-        recipe = tuple(recipe)
-
-        for subrecipe in recipe:
-            if not isinstance(subrecipe, str) and not callable(subrecipe):
+        recipe_type = type(recipe)
+        if recipe_type is str or (
+            recipe_type is not list
+            and recipe_type is not tuple
+            and (isinstance(recipe, str) or not hasattr(recipe_type, "__iter__"))
+        ):
+            recipe_iter: Iterable[ApiSubRecipe] = (cast(ApiSubRecipe, recipe),)
+        else:
+            recipe_iter = cast(Iterable[ApiSubRecipe], recipe)
+
+        subrecipes: list[SubRecipe] = []
+        for subrecipe in recipe_iter:
+            if isinstance(subrecipe, str):
+                # Intern shell commands, as the same commands are often used in
+                # multiple rules.
+                subrecipes.append(sys.intern(str(subrecipe)))
+            elif isinstance(subrecipe, (list, tuple)):
+                if not subrecipe or not all(isinstance(arg, str) for arg in subrecipe):
+                    raise TypeError(f"Invalid recipe type: '{subrecipe}'.")
+                subrecipes.append(tuple(sys.intern(str(arg)) for arg in subrecipe))
+            elif callable(subrecipe):
+                subrecipes.append(subrecipe)
+            else:
                 raise TypeError(f"Invalid recipe type: '{subrecipe}'.")
 
+        recipe_cast = tuple(subrecipes)
+
     rule_instance = Rule(
         target=target,
-        deps=deps,
-        recipe=recipe,
+        deps=deps_cast,
+        recipe=recipe_cast,
         help=help,
         parallel=parallel,
         listed=listed,
@@ -1,16 +1,23 @@
 """Module for managing & sorting Rules as a directed acyclic graph."""
+import datetime
 import graphlib
-from typing import Iterable, Mapping
+from typing import Callable, Generator, Iterable, Mapping, Optional, Union
 
 from .common import Rule, Target
-from .object import Phony
+from .object import Phony, TimeTracked
 
 
 class RuleSorter(graphlib.TopologicalSorter):
-    def __init__(self, rules: Iterable[Rule], target: Target):
+    def __init__(
+        self,
+        rules: Union[Iterable[Rule], Mapping[str, Rule]],
+        target: Target,
+        concurrent_deps: bool = False,
+    ):
         """TopologicalSorter for sorting Rules to be run to update a target.
 
-        The graph for the sorting is built with the function get_target_graph.
+        The graph for the sorting is built with the function
+        build_target_graph.
 
         The nodes of RuleSorter are the ids of the targets.
 
@@ -20,12 +27,19 @@ class RuleSorter(graphlib.TopologicalSorter):
         Parameters
         ----------
         rules
-            The Rules defined in a girdfile.
+            The Rules defined in a girdfile, or a mapping from target ids to
+            them, as returned by the function get_map_target_rule. Pass the
+            mapping when creating multiple RuleSorters for the same Rules.
         target
             The target to be updated.
+        concurrent_deps
+            See the function build_target_graph.
         """
-        self._map_target_rule = {rule.target.id: rule for rule in rules}
-        self.graph = build_target_graph(self.map_target_rule, target)
+        if isinstance(rules, Mapping):
+            self._map_target_rule = rules
+        else:
+            self._map_target_rule = get_map_target_rule(rules)
+        self.graph = build_target_graph(self.map_target_rule, target, concurrent_deps)
         super().__init__(self.graph)
         self.prepare()
 
@@ -34,19 +48,65 @@ class RuleSorter(graphlib.TopologicalSorter):
         return bool(self.graph)
 
     @property
-    def map_target_rule(self) -> dict[str, Rule]:
+    def map_target_rule(self) -> Mapping[str, Rule]:
         """Mapping from target ids to their Rules."""
         return self._map_target_rule
 
 
+def get_map_target_rule(rules: Iterable[Rule]) -> dict[str, Rule]:
+    """Get a mapping from target ids to Rules."""
+    return {rule.target.id: rule for rule in rules}
+
+
+def get_function_deps(
+    map_target_rule: Mapping[str, Rule],
+    target: Target,
+) -> list[Callable[[], bool]]:
+    """Get the unique function dependencies of the Rule of a target and of all
+    the Rules it depends on, directly or indirectly.
+    """
+    functions: dict[int, Callable[[], bool]] = dict()
+    visited = {target.id}
+    stack = [map_target_rule[target.id]]
+    while stack:
+        rule = stack.pop()
+        for dep in rule.deps:
+            if callable(dep):
+                functions.setdefault(id(dep), dep)
+            else:
+                dep_id = dep.id
+                if dep_id in map_target_rule and dep_id not in visited:
+                    visited.add(dep_id)
+                    stack.append(map_target_rule[dep_id])
+    return list(functions.values())
+
+
+def call_function_deps(functions: list[Callable[[], bool]]) -> dict[int, bool]:
+    """Call function dependencies concurrently in separate threads. Return the
+    results by the ids of the functions.
+    """
+    if len(functions) < 2:
+        return {id(function): function() for function in functions}
+
+    # Imported here, as function dependencies are called concurrently only on
+    # request.
+    import concurrent.futures
+
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        results = executor.map(lambda function: function(), functions)
+        return {id(function): result for function, result in zip(functions, results)}
+
+
 def build_target_graph(
     map_target_rule: Mapping[str, Rule],
     target: Target,
+    concurrent_deps: bool = False,
 ) -> dict[str, set[str]]:
     """Build a graph of rule target dependencies. Include only outdated targets.
 
     This function will call the dependency functions that are either direct or
-    indirect dependencies for the target.
+    indirect dependencies for the target, once per function. By default, the
+    functions are called in the order they are encountered in, depth-first.
 
     See the function `gird.rule` for the cases when a target should be
     considered outdated.
@@ -57,69 +117,151 @@ def build_target_graph(
         Mapping from target ids to Rules.
     target
         The target to be updated.
+    concurrent_deps
+        If True, call the dependency functions concurrently in separate threads
+        before building the graph, e.g., to not wait for their network I/O one
+        after another. The functions must then not depend on being called in
+        the main thread, or in any particular order.
 
     Returns
     -------
     graph
         Mapping from target ids to dependency target ids. Only such targets will
         be included that need to be updated to update the given target. The
-        graph will be empty if there's nothing to update.
+        graph will be empty if there's nothing to update. The targets are in
+        topological order, i.e., dependencies before their dependents.
     """
 
-    def build_graph(rule: Rule) -> dict[str, set[str]]:
-        """Recursively build the target dependency graph."""
-        graph: dict[str, set[str]] = dict()
+    # Results of function dependencies by the ids of the functions.
+    function_dep_results: dict[int, bool]
+    if concurrent_deps:
+        # Call the functions beforehand, so that they can be called
+        # concurrently.
+        function_dep_results = call_function_deps(
+            get_function_deps(map_target_rule, target)
+        )
+    else:
+        function_dep_results = dict()
+
+    def get_function_dep_result(function: Callable[[], bool]) -> bool:
+        """Get the result of a function dependency, calling the function only
+        once.
+        """
+        function_id = id(function)
+        if function_id not in function_dep_results:
+            function_dep_results[function_id] = function()
+        return function_dep_results[function_id]
+
+    # Timestamps by object ids. The same dependencies are usually encountered
+    # multiple times when building the graph.
+    timestamps: dict[str, Optional[datetime.datetime]] = dict()
+
+    def get_timestamp(
+        obj: TimeTracked,
+        obj_id: str,
+    ) -> Optional[datetime.datetime]:
+        """Get the timestamp of an object, fetching it only once per object id."""
+        if obj_id not in timestamps:
+            timestamps[obj_id] = obj.timestamp
+        return timestamps[obj_id]
+
+    graph: dict[str, set[str]] = dict()
+    # Outdatedness by target ids. Each Rule is visited only once, even if it's
+    # a dependency of multiple Rules.
+    outdated: dict[str, bool] = dict()
+
+    def build_graph(rule: Rule, node: str) -> Generator[tuple[Rule, str], bool, bool]:
+        """Build the target dependency graph for a Rule with the given node,
+        i.e., target id. Yield the Rules & nodes of dependencies, and receive
+        whether their targets are outdated. Return whether the target of the
+        Rule is outdated.
+        """
         predecessors: set[str] = set()
 
         if isinstance(rule.target, Phony):
             target_timestamp = None
         else:
-            target_timestamp = rule.target.timestamp
+            target_timestamp = get_timestamp(rule.target, node)
         # Rule is outdated because it has a Phony target or its target doesn't
         # exist.
         rule_is_outdated = target_timestamp is None
 
-        if rule.deps:
-            for dep in rule.deps:
-                if callable(dep):
-                    # Rule is outdated because its function dependency returns True.
-                    rule_is_outdated |= dep()
-                else:
-                    if dep.id in map_target_rule:
-                        dep_rule = map_target_rule[dep.id]
-
-                        dep_graph = build_graph(dep_rule)
-                        dep_is_outdated = bool(dep_graph)
-
-                        if dep_is_outdated:
-                            predecessors.add(dep_rule.target.id)
-                            graph.update(dep_graph)
-
-                        # Rule is outdated because its rule dependency is outdated.
-                        rule_is_outdated |= dep_is_outdated
-
-                        dep = dep_rule.target
-                    elif isinstance(dep, Phony):
-                        raise TypeError(
-                            f"Phony target '{dep}' of no rule used as a dependency."
-                        )
-                    elif dep.timestamp is None:
-                        raise RuntimeError(
-                            f"Nonexistent dependency '{dep}' is not the target "
-                            f"of any rule."
-                        )
-
-                    if target_timestamp is not None and hasattr(dep, "timestamp"):
-                        dep_timestamp = dep.timestamp
-                        if dep_timestamp is not None:
-                            # Rule is outdated because its target is older than its
-                            # dependency.
-                            rule_is_outdated |= dep_timestamp > target_timestamp
+        for dep in rule.deps:
+            if callable(dep):
+                # Rule is outdated because its function dependency returns True.
+                rule_is_outdated |= get_function_dep_result(dep)
+            else:
+                # Get the id only once, as it may be costly to compute.
+                dep_id = dep.id
+                dep_rule = map_target_rule.get(dep_id)
+                if dep_rule is not None:
+                    dep_is_outdated = yield dep_rule, dep_id
+
+                    if dep_is_outdated:
+                        predecessors.add(dep_id)
+
+                    # Rule is outdated because its rule dependency is outdated.
+                    rule_is_outdated |= dep_is_outdated
+
+                    dep = dep_rule.target
+                elif isinstance(dep, Phony):
+                    raise TypeError(
+                        f"Phony target '{dep}' of no rule used as a dependency."
+                    )
+                elif get_timestamp(dep, dep_id) is None:
+                    raise RuntimeError(
+                        f"Nonexistent dependency '{dep}' is not the target "
+                        f"of any rule."
+                    )
+
+                # Compare timestamps only if the Rule isn't already known to be
+                # outdated, as the comparison couldn't change the outcome.
+                if (
+                    not rule_is_outdated
+                    and target_timestamp is not None
+                    and hasattr(dep, "timestamp")
+                ):
+                    dep_timestamp = get_timestamp(dep, dep_id)
+                    if dep_timestamp is not None:
+                        # Rule is outdated because its target is older than its
+                        # dependency.
+                        rule_is_outdated |= dep_timestamp > target_timestamp
 
         if rule_is_outdated:
-            node = rule.target.id
             graph[node] = predecessors
 
-        return graph
+        return rule_is_outdated
+
+    # Run build_graph iteratively with an explicit stack instead of recursion,
+    # to support long chains of dependencies.
+    root_node = target.id
+    stack = [(root_node, build_graph(map_target_rule[root_node], root_node))]
+    nodes_in_progress = {root_node}
+    # Outdatedness of the latest finished dependency. None to start a new
+    # generator.
+    dep_is_outdated: Optional[bool] = None
+    while stack:
+        node, generator = stack[-1]
+        try:
+            if dep_is_outdated is None:
+                dep_rule, dep_node = next(generator)
+            else:
+                dep_rule, dep_node = generator.send(dep_is_outdated)
+        except StopIteration as stop:
+            stack.pop()
+            nodes_in_progress.remove(node)
+            outdated[node] = dep_is_outdated = stop.value
+            continue
+
+        if dep_node in outdated:
+            dep_is_outdated = outdated[dep_node]
+        elif dep_node in nodes_in_progress:
+            cycle = [node for node, _ in stack]
+            cycle = cycle[cycle.index(dep_node) :] + [dep_node]
+            raise graphlib.CycleError("nodes are in a cycle", cycle)
+        else:
+            stack.append((dep_node, build_graph(dep_rule, dep_node)))
+            nodes_in_progress.add(dep_node)
+            dep_is_outdated = None
 
-    return build_graph(map_target_rule[target.id])
+    return graph
@@ -1,12 +1,165 @@
 """Module for running Rules."""
-import concurrent.futures
+import contextlib
+import errno
 import io
-import subprocess
+import re
+import shlex
+import shutil
+import signal
 import sys
+from typing import Optional, Sequence, Union
 
-from .common import Rule
+from .common import Rule, SubRecipe
 from .rulesorter import RuleSorter
 
+# Characters with special meaning in shell commands, and whitespace other than
+# spaces & tabs, which the shell doesn't split words on. Commands without them
+# are simple enough to be run without a shell.
+SHELL_SPECIAL_CHARACTERS = re.compile(r"[|&;<>()$`\\\"'*?\[\]{}~#]|[^\S \t]")
+
+# Shell builtins & keywords that may also be found as executables in PATH. The
+# shell runs the builtins, which may behave differently, e.g., 'echo -e'.
+SHELL_BUILTINS = frozenset(
+    (
+        "[",
+        "alias",
+        "bg",
+        "cd",
+        "command",
+        "echo",
+        "false",
+        "fg",
+        "getopts",
+        "hash",
+        "jobs",
+        "kill",
+        "printf",
+        "pwd",
+        "read",
+        "test",
+        "time",
+        "times",
+        "true",
+        "type",
+        "ulimit",
+        "umask",
+        "unalias",
+        "wait",
+    )
+)
+
+
+def get_command_args(command: str) -> Optional[list[str]]:
+    """Get the arguments of a shell command that can be run without a shell,
+    i.e., a command without special characters, the executable of which is
+    found in PATH. Return None if the command needs to be run in a shell, e.g.,
+    if the first word is a shell builtin or a variable assignment.
+    """
+    if SHELL_SPECIAL_CHARACTERS.search(command):
+        return None
+    args = command.split()
+    if (
+        not args
+        or "=" in args[0]
+        or args[0] in SHELL_BUILTINS
+        or shutil.which(args[0]) is None
+    ):
+        return None
+    return args
+
+
+def run_command(
+    command: Union[str, Sequence[str]],
+    shell: bool = False,
+    output: Optional[io.BytesIO] = None,
+) -> int:
+    """Run a command & return its exit code. If output is given, capture the
+    stdout & stderr of the command into it instead of letting the command write
+    directly to the file descriptors of this process.
+    """
+    # Imported here to keep the startup of the CLI fast when no commands are run.
+    import subprocess
+
+    if output is None:
+        return subprocess.run(command, shell=shell).returncode
+    process = subprocess.run(
+        command,
+        shell=shell,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    output.write(process.stdout)
+    return process.returncode
+
+
+def get_command_error(command: str, returncode: int) -> RuntimeError:
+    """Get an error for a command that exited with a nonzero exit code. A
+    negative exit code is the number of the signal that terminated the command.
+    """
+    if returncode < 0:
+        try:
+            signal_name = signal.Signals(-returncode).name
+        except ValueError:
+            signal_name = str(-returncode)
+        return RuntimeError(
+            f"Command '{command}' was terminated by signal {signal_name}."
+        )
+    return RuntimeError(f"Command '{command}' exited with error code {returncode}.")
+
+
+def run_subrecipe(
+    subrecipe: SubRecipe,
+    dry_run: bool = False,
+    output: Optional[io.BytesIO] = None,
+):
+    """Run a single SubRecipe. For the parameters, see the function 'run_rule'."""
+    if isinstance(subrecipe, str):
+        if dry_run:
+            print(subrecipe)
+            return
+        # Avoid starting a shell process for simple commands.
+        args = get_command_args(subrecipe)
+        returncode = None
+        if args is not None:
+            try:
+                returncode = run_command(args, output=output)
+            except OSError as e:
+                # The shell runs also executables that can't be executed
+                # directly, e.g., scripts without a shebang line.
+                if e.errno != errno.ENOEXEC:
+                    raise
+        if returncode is None:
+            returncode = run_command(subrecipe, shell=True, output=output)
+        if returncode != 0:
+            raise get_command_error(subrecipe, returncode)
+    elif isinstance(subrecipe, tuple):
+        command = shlex.join(subrecipe)
+        if dry_run:
+            print(command)
+            return
+        returncode = run_command(subrecipe, output=output)
+        if returncode != 0:
+            raise get_command_error(command, returncode)
+    else:
+        if dry_run:
+            print(f"{subrecipe.__name__}()")
+        else:
+            subrecipe()
+
+
+def print_output(output: bytes, encoding: str):
+    """Print the captured output of a recipe. Write the bytes as they are, unless
+    sys.stdout has no binary buffer, e.g., when it's redirected to a StringIO.
+    Then decode the bytes, showing the ones that can't be decoded as escapes.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        print(output.decode(encoding, errors="backslashreplace"), end="")
+        return
+    sys.stdout.flush()
+    buffer.write(output)
+    buffer.flush()
+
 
 def run_rule(
     rule: Rule,
@@ -24,36 +177,35 @@ def run_rule(
         execute them.
     output_sync
         Print the output of the run all at once after the entire recipe has
-        finished.
+        finished. The output of commands includes both their stdout & stderr.
     """
-    if rule.recipe is None:
+    if not rule.recipe:
         return
 
-    stdout_original = sys.stdout
-    string_io = io.StringIO()
-    if output_sync:
-        sys.stdout = string_io
-
-    for subrecipe in rule.recipe:
-        if isinstance(subrecipe, str):
-            if dry_run:
-                print(subrecipe)
-            else:
-                process = subprocess.run(subrecipe, shell=True)
-                if process.returncode > 0:
-                    raise RuntimeError(
-                        f"Command '{subrecipe}' exited with error code {process.returncode}."
-                    )
-        else:
-            if dry_run:
-                print(f"{subrecipe.__name__}()")
-            else:
-                subrecipe()
+    if not output_sync:
+        for subrecipe in rule.recipe:
+            run_subrecipe(subrecipe, dry_run=dry_run)
+        return
 
-    if output_sync:
-        output = string_io.getvalue()
-        sys.stdout = stdout_original
-        print(output, end="")
+    # Capture the output of commands as bytes, and write the output of functions
+    # into the same buffer, encoded, to keep the order of the output.
+    encoding = getattr(sys.stdout, "encoding", None) or "utf-8"
+    output = io.BytesIO()
+    output_text = io.TextIOWrapper(
+        output,
+        encoding=encoding,
+        errors="backslashreplace",
+        write_through=True,
+    )
+    try:
+        with contextlib.redirect_stdout(output_text):
+            for subrecipe in rule.recipe:
+                run_subrecipe(subrecipe, dry_run=dry_run, output=output)
+    finally:
+        # Detach to not close the buffer along with the wrapper.
+        output_text.detach()
+        # Print the output also when the recipe fails.
+        print_output(output.getvalue(), encoding)
 
 
 def run_rules(
@@ -76,13 +228,35 @@ def run_rules(
     output_sync
         See the function 'run_rule'.
     """
+    # Imported here to keep the startup of the CLI fast when no rules are run.
+    import concurrent.futures
+
     executor = concurrent.futures.ProcessPoolExecutor()
     map_future_target: dict[concurrent.futures.Future, str] = dict()
+    map_target_rule = sorter.map_target_rule
+
+    # Numbers of the targets directly depending on each target.
+    successor_counts = dict.fromkeys(sorter.graph, 0)
+    for predecessors in sorter.graph.values():
+        for predecessor in predecessors:
+            successor_counts[predecessor] += 1
+
+    def get_target_priority(target: str) -> tuple[bool, int, str]:
+        """Start the targets with the most dependents first, to make more
+        targets ready sooner. Run the Rules that aren't run in parallel last,
+        as they block submitting the others. Break ties by the targets.
+        """
+        return (
+            not map_target_rule[target].parallel,
+            -successor_counts[target],
+            target,
+        )
+
     while sorter.is_active():
-        targets = sorter.get_ready()
+        targets = sorted(sorter.get_ready(), key=get_target_priority)
         targets_done = set()
         for target in targets:
-            rule = sorter.map_target_rule[target]
+            rule = map_target_rule[target]
             if rule.parallel:
                 future = executor.submit(
                     run_rule,
@@ -100,14 +274,16 @@ def run_rules(
                 targets_done.add(target)
 
         if not targets_done:
-            completed_future = next(
-                concurrent.futures.as_completed(map_future_target.keys())
+            # Collect all the futures completed by now at once.
+            completed_futures, _ = concurrent.futures.wait(
+                map_future_target.keys(),
+                return_when=concurrent.futures.FIRST_COMPLETED,
             )
-            target = map_future_target.pop(completed_future)
-            exception = completed_future.exception()
-            if exception:
-                raise exception
-            targets_done.add(target)
-
-        for target in targets_done:
-            sorter.done(target)
+            for completed_future in completed_futures:
+                target = map_future_target.pop(completed_future)
+                exception = completed_future.exception()
+                if exception:
+                    raise exception
+                targets_done.add(target)
+
+        sorter.done(*targets_done)
@@ -1,14 +1,18 @@
-from itertools import chain
 from pathlib import Path
 
 from gird import Phony, rule
-from scripts import assert_readme_updated, get_wheel_path, render_readme
+from scripts import (
+    assert_readme_updated,
+    get_wheel_path,
+    list_directory_paths,
+    render_readme,
+)
 
 WHEEL_PATH = get_wheel_path()
 
 RULE_PYTEST = rule(
     target=Phony("pytest"),
-    recipe="pytest -n auto --cov=gird --cov-report=xml",
+    recipe="pytest -n auto --dist loadfile --cov=gird --cov-report=xml",
     help="Run pytest & get code coverage report.",
 )
 
@@ -18,11 +22,21 @@ RULE_MYPY = rule(
     help="Run mypy.",
 )
 
+# Run Black & isort in parallel as separate rules. Don't include the inner
+# rules in `gird list`.
 RULE_CHECK_FORMATTING = rule(
     target=Phony("check_formatting"),
-    recipe=[
-        "black --check gird scripts test girdfile.py",
-        "isort --check gird scripts test girdfile.py",
+    deps=[
+        rule(
+            target=Phony("check_black"),
+            recipe="black --check gird scripts test girdfile.py",
+            listed=False,
+        ),
+        rule(
+            target=Phony("check_isort"),
+            recipe="isort --check gird scripts test girdfile.py",
+            listed=False,
+        ),
     ],
     help="Check formatting with Black & isort.",
 )
@@ -48,10 +62,11 @@ rule(
 
 rule(
     target=Path("README.md"),
-    deps=chain(
-        *(Path(path).iterdir() for path in ("scripts", "gird")),
-        [Path("girdfile.py"), Path("pyproject.toml")],
-    ),
+    deps=[
+        *list_directory_paths("scripts", "gird"),
+        Path("girdfile.py"),
+        Path("pyproject.toml"),
+    ],
     recipe=render_readme,
     help="Render README.md based on README_template.md.",
 )
@@ -1,2 +1,3 @@
 from .get_wheel_path import get_wheel_path
+from .list_directory_paths import list_directory_paths
 from .render_readme import assert_readme_updated, render_readme
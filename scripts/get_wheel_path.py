@@ -1,14 +1,22 @@
+import functools
 import pathlib
 
-import tomli
+try:
+    import tomllib
+except ImportError:
+    # Python < 3.11
+    import tomli as tomllib
 
+# Translation table for normalizing a project name for a wheel file name.
+WHEEL_NAME_TRANSLATION = str.maketrans({".": "_", "-": "_"})
 
+
+@functools.lru_cache(maxsize=1)
 def get_wheel_path() -> pathlib.Path:
     """Get the Path of a wheel that would be generated for the current project
     version.
     """
-    with open(pathlib.Path("pyproject.toml"), "rb") as f:
-        toml = tomli.load(f)
-    name = toml["tool"]["poetry"]["name"].replace(".", "_")
+    toml = tomllib.loads(pathlib.Path("pyproject.toml").read_text("utf-8"))
+    name = toml["tool"]["poetry"]["name"].translate(WHEEL_NAME_TRANSLATION)
     version = toml["tool"]["poetry"]["version"]
     return pathlib.Path("dist") / f"{name}-{version}-py3-none-any.whl"
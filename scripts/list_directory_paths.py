@@ -0,0 +1,19 @@
+import os
+import pathlib
+
+
+def list_directory_paths(*directories: str) -> list[pathlib.Path]:
+    """List the Paths of the files in directories, sorted to not depend on the
+    order of the entries in the file system. Use os.scandir, which reads each
+    directory with a single scan, and tells the types of the entries mostly
+    without additional stat calls. Subdirectories, e.g., __pycache__, are
+    excluded.
+    """
+    paths = []
+    for directory in directories:
+        with os.scandir(directory) as entries:
+            paths.extend(
+                pathlib.Path(entry.path) for entry in entries if entry.is_file()
+            )
+    paths.sort()
+    return paths
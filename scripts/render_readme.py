@@ -1,18 +1,24 @@
-import subprocess
+import contextlib
+import functools
+import io
+import re
 from pathlib import Path
-
-from jinja2 import Environment, FileSystemLoader
+from typing import TYPE_CHECKING
 
 from gird import rule
+from gird.gird import ListConfig, list_rules
+from gird.girdfile import import_girdfile
+
+if TYPE_CHECKING:
+    from jinja2 import Template
 
 ROOT_PATH = Path(__file__).parents[1]
 GIRDFILE = ROOT_PATH / "girdfile.py"
 README_TEMPLATE = Path(__file__).parent / "README_template.md"
 README = ROOT_PATH / "README.md"
 
-JINJA_ENV = Environment(
-    loader=FileSystemLoader(README_TEMPLATE.parent), keep_trailing_newline=True
-)
+# Indentation & doctest prompt at the start of a line.
+DOCTEST_PROMPT = re.compile(r"^[ \t]*(?:>>> ?)?", re.MULTILINE)
 
 AUTOGENERATION_NOTE = (
     "[//]: # (This README.md is autogenerated from README_template.md with the script\n"
@@ -25,10 +31,16 @@ def get_readme_example_girdfile() -> str:
 
 
 def get_readme_example_gird_list() -> str:
-    process = subprocess.run(["gird", "list"], text=True, stdout=subprocess.PIPE)
-    return f"```\n{process.stdout}```"
+    """Get the output of `gird list` for the girdfile.py. Import the girdfile.py
+    & list its rules in this process instead of running the CLI.
+    """
+    rules = import_girdfile(GIRDFILE)
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+        list_rules(rules, ListConfig(question=False, all=False))
+    return f"```\n{output.getvalue()}```"
 
 
+@functools.lru_cache(maxsize=1)
 def get_readme_usage_notes() -> str:
     """Format the usage notes section for README.md based on the docstring of
     the gird.rule function.
@@ -45,21 +57,25 @@ def get_readme_usage_notes() -> str:
     return notes
 
 
+@functools.lru_cache(maxsize=1)
 def get_readme_example_rules() -> str:
     """Format the example section for README.md based on the docstring of the
-    gird.rule function.
+    gird.rule function. The docstring doesn't change within a process, so the
+    result is cached.
     """
     rule_doc = rule.__doc__
     examples_raw = rule_doc.split("Examples\n    --------\n\n")[1]
     items_raw = examples_raw.split("\n\n")
     items_formatted = []
     for item_raw in items_raw:
+        if item_raw.lstrip().startswith(">>>"):
+            # Remove the prompts of all the lines of a code block at once.
+            items_formatted.append(
+                f"```python\n{DOCTEST_PROMPT.sub('', item_raw)}\n```"
+            )
+            continue
         lines_raw = [line_raw.strip() for line_raw in item_raw.split("\n")]
-        if lines_raw[0].startswith(">>>"):
-            lines_formatted = [line_raw[4:] for line_raw in lines_raw]
-            lines_formatted.insert(0, "```python")
-            lines_formatted.append("```")
-        elif len(items_formatted) == 0 or items_formatted[-1].startswith("```python"):
+        if len(items_formatted) == 0 or items_formatted[-1].startswith("```python"):
             lines_raw_joined = " ".join(lines_raw)
             header, *rest = lines_raw_joined.split(". ")
             if header.endswith("."):
@@ -76,8 +92,24 @@ def get_readme_example_rules() -> str:
     return examples_formatted
 
 
+@functools.lru_cache(maxsize=1)
+def get_readme_template() -> "Template":
+    """Get the compiled README template. Import jinja2 only here, as the
+    girdfile.py imports this module on every invocation of gird.
+    """
+    from jinja2 import Environment, FileSystemLoader
+
+    # The template won't change while rendering, so don't check it for updates.
+    jinja_env = Environment(
+        loader=FileSystemLoader(README_TEMPLATE.parent),
+        keep_trailing_newline=True,
+        auto_reload=False,
+    )
+    return jinja_env.get_template(README_TEMPLATE.name)
+
+
 def get_readme_contents() -> str:
-    template = JINJA_ENV.get_template(README_TEMPLATE.name)
+    template = get_readme_template()
     usage_notes = get_readme_usage_notes()
     example_girdfile = get_readme_example_girdfile()
     example_gird_list = get_readme_example_gird_list()
@@ -92,12 +124,24 @@ def get_readme_contents() -> str:
     return readme_contents
 
 
+def is_file_text_equal(path: Path, text: str, chunk_size: int = 65536) -> bool:
+    """Is the text in a file equal to the given text. Read & compare the file in
+    chunks, to stop at the first difference without reading the whole file.
+    """
+    with open(path) as file:
+        for start in range(0, len(text), chunk_size):
+            if file.read(chunk_size) != text[start : start + chunk_size]:
+                return False
+        # The file must not have any text left.
+        return not file.read(1)
+
+
 def assert_readme_updated():
     """Raise an AssertionError if the contents of the README file don't equal
     the text returned by get_readme_contents.
     """
     readme_contents = get_readme_contents()
-    if README.read_text() != readme_contents:
+    if not is_file_text_equal(README, readme_contents):
         raise AssertionError("README.md is not updated.")
 
 
@@ -1,4 +1,5 @@
 import pathlib
+import shutil
 import subprocess
 import sys
 import time
@@ -19,12 +20,7 @@ PATH_TARGETS_PY = DIR_TMP / "targets.py"
 
 
 def remove_dir(dir: pathlib.Path):
-    if not dir.exists():
-        return
-
-    for path in dir.iterdir():
-        path.unlink()
-    dir.rmdir()
+    shutil.rmtree(dir, ignore_errors=True)
 
 
 def benchmark_make():
@@ -32,6 +28,7 @@ def benchmark_make():
 
     target_counts = [1, 500, 1000]
     time_diffs = []
+    time_diffs_warm = []
     for target_count in target_counts:
         remove_dir(DIR_CACHE)
         targets_str = " ".join(f"{DIR_CACHE.name}/file{i}" for i in range(target_count))
@@ -40,8 +37,13 @@ def benchmark_make():
         subprocess.run("make -j all --silent", shell=True, cwd=DIR_BENCHMARK)
         t1 = time.time()
         time_diffs.append(t1 - t0)
+        # Run again with the targets already built.
+        subprocess.run("make -j all --silent", shell=True, cwd=DIR_BENCHMARK)
+        t2 = time.time()
+        time_diffs_warm.append(t2 - t1)
 
     plt.plot(target_counts, time_diffs, label="make")
+    plt.plot(target_counts, time_diffs_warm, label="make, rerun")
 
 
 def benchmark_gird(python_bin_path: pathlib.Path):
@@ -52,6 +54,7 @@ def benchmark_gird(python_bin_path: pathlib.Path):
 
     target_counts = [1, 500, 1000]
     time_diffs = []
+    time_diffs_warm = []
     for target_count in target_counts:
         remove_dir(DIR_PYCACHE)
         remove_dir(DIR_CACHE)
@@ -62,6 +65,12 @@ def benchmark_gird(python_bin_path: pathlib.Path):
         )
         t1 = time.time()
         time_diffs.append(t1 - t0)
+        # Run again with the targets already built.
+        subprocess.run(
+            f"{path_python} {path_gird} run all", shell=True, cwd=DIR_BENCHMARK
+        )
+        t2 = time.time()
+        time_diffs_warm.append(t2 - t1)
 
     python_version = (
         subprocess.run(
@@ -75,6 +84,11 @@ def benchmark_gird(python_bin_path: pathlib.Path):
     )
 
     plt.plot(target_counts, time_diffs, label=f"gird, python {python_version}")
+    plt.plot(
+        target_counts,
+        time_diffs_warm,
+        label=f"gird, python {python_version}, rerun",
+    )
 
 
 def main():
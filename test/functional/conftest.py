@@ -1,12 +1,15 @@
+import contextlib
+import io
 import os
 import pathlib
 import shutil
 import subprocess
-import time
+import sys
 
 import pytest
 
-from gird.gird import RunConfig, SubcommandResult
+from gird.common import Rule
+from gird.gird import RunConfig, SubcommandResult, main
 from gird.gird import run_rule as gird_run_rule
 from gird.girdfile import import_girdfile
 
@@ -27,26 +30,32 @@ def run():
         ----------
         pytest_tmp_path
             Temporary directory to run a test in. Will be added to PYTHONPATH
-            environment variable, and used as cwd in the subprocess.run call.
+            environment variable of the subprocess, and used as cwd in the
+            subprocess.run call.
         args
             Positional arguments for subprocess.run.
         raise_on_error
             If True, raise a RuntimeError if the returncode of the command
             returns non-zero exit code.
         kwargs
-            Keyword arguments for subprocess.run.
+            Keyword arguments for subprocess.run. A given 'env' will be used
+            instead of os.environ as the base of the environment variables.
         """
+        env = dict(kwargs.pop("env", None) or os.environ)
         # pytest_tmp_path is not the directory where pytest is originally
-        # invoked, so it must be added to PYTHONPATH.
-        pythonpath = os.environ.get("PYTHONPATH", "")
+        # invoked, so it must be added to PYTHONPATH. Set it only for the
+        # subprocess, to not grow PYTHONPATH of this process with every call.
+        pythonpath = env.get("PYTHONPATH", "")
         if pythonpath:
             pythonpath += os.pathsep
-        pythonpath += str(pytest_tmp_path.resolve())
-        os.environ["PYTHONPATH"] = pythonpath
+        # pytest's tmp_path is already absolute & resolved.
+        pythonpath += str(pytest_tmp_path)
+        env["PYTHONPATH"] = pythonpath
 
         process = subprocess.run(
             *args,
             cwd=pytest_tmp_path,
+            env=env,
             text=True,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
@@ -66,12 +75,78 @@ def run():
     return _run
 
 
+@pytest.fixture
+def run_main():
+    def _run_main(
+        pytest_tmp_path: pathlib.Path,
+        args: list[str],
+        raise_on_error: bool = True,
+    ) -> subprocess.CompletedProcess:
+        """Helper function for running the Gird CLI in this process, which is
+        faster than starting a new one with the fixture 'run'. The recipes of
+        the Rules run in parallel may still print to the file descriptors of
+        the processes running them.
+
+        Parameters
+        ----------
+        pytest_tmp_path
+            Temporary directory to run a test in. Used as the working directory
+            for the duration of the call.
+        args
+            The command line arguments, including the program name.
+        raise_on_error
+            If True, raise a RuntimeError if the CLI exits with a non-zero exit
+            code.
+
+        Returns
+        -------
+        process
+            The arguments, exit code, stdout & stderr of the run, in the form
+            returned by subprocess.run.
+        """
+        argv_original = sys.argv
+        cwd_original = pathlib.Path.cwd()
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        sys.argv = list(args)
+        os.chdir(pytest_tmp_path)
+        try:
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                main()
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else int(bool(e.code))
+        else:
+            returncode = 0
+        finally:
+            sys.argv = argv_original
+            os.chdir(cwd_original)
+
+        process = subprocess.CompletedProcess(
+            args,
+            returncode,
+            stdout=stdout.getvalue(),
+            stderr=stderr.getvalue(),
+        )
+
+        if raise_on_error and process.returncode != 0:
+            command = " ".join(args)
+            raise RuntimeError(
+                f"Command `{command}` returned exit code {process.returncode}.\n"
+                f"Stderr:\n{process.stderr}"
+                f"Stdout:\n{process.stdout}"
+            )
+
+        return process
+
+    return _run_main
+
+
 def _init_tmp_path(
     pytest_tmp_path: pathlib.Path,
     test_dir: pathlib.Path,
 ) -> pathlib.Path:
-    """Initialize pytest tmp_path for Gird, i.e., copy girdfile from test_dir
-    to pytest_tmp_path.
+    """Initialize pytest tmp_path for Gird, i.e., link or copy girdfile from
+    test_dir to pytest_tmp_path.
 
     Parameters
     ----------
@@ -83,14 +158,22 @@ def _init_tmp_path(
     Returns
     -------
     girdfile_path
-        Path of a copied girdfile.py to be used by Gird.
+        Path of a linked or copied girdfile.py to be used by Gird.
     """
     path_girdfile_original = test_dir / "girdfile.py"
     # Use a unique name for the girdfile because the multiprocessing library
     # may get confused on some environments if names must be imported from
     # multiple modules with the same name.
     path_girdfile = pytest_tmp_path / f"girdfile_{test_dir.name}.py"
-    shutil.copy(path_girdfile_original, path_girdfile)
+    # Hard link the girdfile instead of copying it when possible, as the tests
+    # don't modify it.
+    try:
+        os.link(path_girdfile_original, path_girdfile)
+    except FileExistsError:
+        # Already initialized by an earlier call in the same test.
+        pass
+    except OSError:
+        shutil.copy(path_girdfile_original, path_girdfile)
     return path_girdfile
 
 
@@ -99,8 +182,37 @@ def init_tmp_path():
     return _init_tmp_path
 
 
+@pytest.fixture
+def backdate():
+    def _backdate(*paths: pathlib.Path, seconds: int = 1):
+        """Move the modification times of files to the past, preserving their
+        order. Files updated after this will be newer than the given ones,
+        regardless of the resolution of file system timestamps, without
+        waiting.
+
+        Parameters
+        ----------
+        paths
+            Paths of existing files.
+        seconds
+            How much to move the modification times to the past.
+        """
+        for path in paths:
+            stat = path.stat()
+            os.utime(
+                path,
+                ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 1_000_000_000),
+            )
+
+    return _backdate
+
+
 @pytest.fixture
 def run_rule(run):
+    # Rules imported from girdfiles by the paths & modification times of the
+    # girdfiles. A test may run rules of the same girdfile multiple times.
+    imported_rules: dict[tuple[pathlib.Path, int], list[Rule]] = {}
+
     def _run_rule(
         pytest_tmp_path: pathlib.Path,
         test_dir: pathlib.Path,
@@ -116,9 +228,7 @@ def run_rule(run):
         pytest_tmp_path
             Temporary directory to run this test in.
         test_dir
-            Original test directory with girdfile.py. If the directory also
-            contains files named Makefile1 & Makefile2, those will be compared
-            to the Makefiles produced by Gird.
+            Original test directory with girdfile.py.
         target
             The id of the target of the rule to be run, i.e., as it would be
             given in the CLI.
@@ -132,33 +242,38 @@ def run_rule(run):
             test_dir=test_dir,
         )
 
+        # Run in pytest_tmp_path, but restore the working directory afterwards
+        # to not affect the tests run after this one in the same process, be
+        # it the main pytest process or a pytest-xdist worker.
+        cwd_original = pathlib.Path.cwd()
         os.chdir(pytest_tmp_path)
+        try:
+            key = (girdfile, girdfile.stat().st_mtime_ns)
+            if key not in imported_rules:
+                imported_rules[key] = import_girdfile(girdfile)
+            rules = imported_rules[key]
 
-        rules = import_girdfile(girdfile)
+            for rule in rules:
+                if target == rule.target.id:
+                    target = rule.target
+                    break
+            else:
+                raise ValueError(f"Target '{target}' not defined in '{girdfile}'.")
 
-        for rule in rules:
-            if target == rule.target.id:
-                target = rule.target
-                break
-        else:
-            raise ValueError(f"Target '{target}' not defined in '{girdfile}'.")
-
-        run_config = RunConfig(
-            target=target,
-            verbose=False,
-            question=question,
-            dry_run=dry_run,
-            output_sync=output_sync,
-        )
-
-        result = gird_run_rule(
-            rules,
-            run_config,
-        )
+            run_config = RunConfig(
+                target=target,
+                verbose=False,
+                question=question,
+                dry_run=dry_run,
+                output_sync=output_sync,
+            )
 
-        # Wait to make sure targets created by different calls get different
-        # timestamps.
-        time.sleep(0.001)
+            result = gird_run_rule(
+                rules,
+                run_config,
+            )
+        finally:
+            os.chdir(cwd_original)
 
         return result
 
@@ -1,3 +1,4 @@
+import os
 import pathlib
 import shutil
 
@@ -13,19 +14,25 @@ def init_cli_test(pytest_tmp_path) -> list[str]:
     path_run_dir = pytest_tmp_path / "run_dir"
     path_girdfile = path_run_dir / f"girdfile_{TEST_DIR.name}.py"
     path_run_dir.mkdir(exist_ok=True)
-    shutil.copy(path_girdfile_original, path_girdfile)
+    # The targets are created in the directory of the girdfile, so each test
+    # needs its own. Hard link the girdfile instead of copying it when possible.
+    if not path_girdfile.exists():
+        try:
+            os.link(path_girdfile_original, path_girdfile)
+        except OSError:
+            shutil.copy(path_girdfile_original, path_girdfile)
     args = [
         "gird",
         "--girdfile",
-        str(path_girdfile.resolve()),
+        str(path_girdfile),
     ]
     return args
 
 
-def test_cli_no_girdfile(tmp_path, run):
+def test_cli_no_girdfile(tmp_path, run_main):
     """Test functionality with nonexistent girdfile given as argument."""
     girdfile_name = "nonexistent_girdfile.py"
-    process = run(
+    process = run_main(
         tmp_path,
         ["gird", "--girdfile", girdfile_name],
         raise_on_error=False,
@@ -36,10 +43,10 @@ def test_cli_no_girdfile(tmp_path, run):
     )
 
 
-def test_cli_help(tmp_path, run):
+def test_cli_help(tmp_path, run_main):
     """Test CLI argument --help."""
     # Test with nonexistent girdfile.
-    process = run(
+    process = run_main(
         tmp_path,
         ["gird", "--help"],
         raise_on_error=False,
@@ -49,17 +56,17 @@ def test_cli_help(tmp_path, run):
     # Test with an existing girdfile.
     args = init_cli_test(tmp_path)
     args.append("--help")
-    process = run(
+    process = run_main(
         tmp_path,
         args,
     )
     assert process.stdout.startswith("usage: gird")
 
 
-def test_cli_no_arguments(tmp_path, run):
+def test_cli_no_arguments(tmp_path, run_main):
     """Test CLI with no arguments."""
     # Test with nonexistent girdfile.
-    process = run(
+    process = run_main(
         tmp_path,
         ["gird"],
         raise_on_error=False,
@@ -68,27 +75,27 @@ def test_cli_no_arguments(tmp_path, run):
 
     # Test with an existing girdfile.
     args = init_cli_test(tmp_path)
-    process = run(
+    process = run_main(
         tmp_path,
         args,
     )
     assert process.stdout.startswith("usage: gird")
 
 
-def test_cli_verbose(tmp_path, run):
+def test_cli_verbose(tmp_path, run_main):
     """Test CLI argument --verbose."""
     args = init_cli_test(tmp_path)
     args.extend(["--verbose", "target"])
-    run(
+    run_main(
         tmp_path,
         args,
     )
 
 
-def test_cli_list(tmp_path, run):
+def test_cli_list(tmp_path, run_main):
     """Test CLI subcommand 'list'."""
     # Test with nonexistent girdfile.
-    process = run(
+    process = run_main(
         tmp_path,
         ["gird", "list"],
         raise_on_error=False,
@@ -100,7 +107,7 @@ def test_cli_list(tmp_path, run):
 
     args = init_cli_test(tmp_path)
     args.append("list")
-    process = run(
+    process = run_main(
         tmp_path,
         args,
     )
@@ -112,7 +119,7 @@ def test_cli_list(tmp_path, run):
 
     args = init_cli_test(tmp_path)
     args.extend(["list", "--all"])
-    process = run(
+    process = run_main(
         tmp_path,
         args,
     )
@@ -126,7 +133,7 @@ target_with_error2
 
     args = init_cli_test(tmp_path)
     args.extend(["list", "--question"])
-    process = run(
+    process = run_main(
         tmp_path,
         args,
     )
@@ -137,11 +144,11 @@ target_with_error2
     assert process.stdout == rule_listing
 
 
-def test_cli_run(tmp_path, run):
+def test_cli_run(tmp_path, run_main):
     """Test running a rule."""
     args = init_cli_test(tmp_path)
     args.extend(["run", "target"])
-    run(
+    run_main(
         tmp_path,
         args,
     )
@@ -151,11 +158,11 @@ def test_cli_run(tmp_path, run):
     assert path_target.exists()
 
 
-def test_cli_target(tmp_path, run):
+def test_cli_target(tmp_path, run_main):
     """Test running a rule."""
     args = init_cli_test(tmp_path)
     args.append("target")
-    run(
+    run_main(
         tmp_path,
         args,
     )
@@ -165,18 +172,18 @@ def test_cli_target(tmp_path, run):
     assert path_target.exists()
 
 
-def test_cli_run_unnecessary(tmp_path, run):
+def test_cli_run_unnecessary(tmp_path, run_main):
     """Test running a rule target of which is already up to date."""
     path_target = tmp_path / "run_dir" / "target"
 
     args = init_cli_test(tmp_path)
     args.extend(["run", "target"])
-    run(
+    run_main(
         tmp_path,
         args,
     )
 
-    process = run(
+    process = run_main(
         tmp_path,
         args,
     )
@@ -184,12 +191,12 @@ def test_cli_run_unnecessary(tmp_path, run):
     assert process.stdout == "gird: 'target' is up to date.\n"
 
 
-def test_cli_unexisting_target(tmp_path, run):
+def test_cli_unexisting_target(tmp_path, run_main):
     """Test functionality with nonexistent target given as argument."""
     args = init_cli_test(tmp_path)
     target = "nonexistent_target"
     args.append(target)
-    process = run(
+    process = run_main(
         tmp_path,
         args,
         raise_on_error=False,
@@ -200,13 +207,13 @@ def test_cli_unexisting_target(tmp_path, run):
     )
 
 
-def test_cli_run_rule_with_error(tmp_path, run):
+def test_cli_run_rule_with_error(tmp_path, run_main):
     """Test running a rule that causes an error."""
     args = init_cli_test(tmp_path)
 
     target = "target_with_error1"
     args1 = args + [target]
-    process = run(
+    process = run_main(
         tmp_path,
         args1,
         raise_on_error=False,
@@ -216,7 +223,7 @@ def test_cli_run_rule_with_error(tmp_path, run):
 
     target = "target_with_error2"
     args2 = args + [target]
-    process = run(
+    process = run_main(
         tmp_path,
         args2,
         raise_on_error=False,
@@ -228,7 +235,9 @@ def test_cli_run_rule_with_error(tmp_path, run):
 
 
 def test_cli_question(tmp_path, run):
-    """Test the CLI argument '--question'."""
+    """Test the CLI argument '--question'. Run the CLI in a subprocess to test
+    the exit codes of the actual program.
+    """
     args = init_cli_test(tmp_path)
     args.extend(["target", "--question"])
     process = run(
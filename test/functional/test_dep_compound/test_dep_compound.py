@@ -3,7 +3,7 @@ import pathlib
 TEST_DIR = pathlib.Path(__file__).parent
 
 
-def test_dep_compound_false(tmp_path, run_rule):
+def test_dep_compound_false(tmp_path, run_rule, backdate):
     """Test that a recipe is run if any of the dependencies of its rule are
     updated.
     """
@@ -19,6 +19,7 @@ def test_dep_compound_false(tmp_path, run_rule):
         target="target_false",
     )
 
+    backdate(path_dep_path, path_dep_rule, path_target)
     mtime_first = path_target.stat().st_mtime_ns
 
     run_rule(
@@ -53,6 +54,10 @@ def test_dep_compound_false(tmp_path, run_rule):
 
     assert mtime_third == mtime_fourth
 
+    # Make sure the dependency will be updated to be newer than the target.
+    backdate(path_dep_path, path_dep_rule, path_target)
+    mtime_fourth = path_target.stat().st_mtime_ns
+
     path_dep_rule.touch()
 
     run_rule(
@@ -76,7 +81,7 @@ def test_dep_compound_false(tmp_path, run_rule):
     assert mtime_fifth == mtime_sixth
 
 
-def test_dep_compound_true(tmp_path, run_rule):
+def test_dep_compound_true(tmp_path, run_rule, backdate):
     """Test that a recipe is run if a dependency function returns True and
     the target exists, regardless of other dependencies.
     """
@@ -91,6 +96,7 @@ def test_dep_compound_true(tmp_path, run_rule):
         target="target_true",
     )
 
+    backdate(path_target)
     mtime_first = path_target.stat().st_mtime_ns
 
     run_rule(
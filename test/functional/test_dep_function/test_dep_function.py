@@ -28,7 +28,7 @@ def test_dep_function_false(tmp_path, run_rule):
     assert mtime_first == mtime_second
 
 
-def test_dep_function_true(tmp_path, run_rule):
+def test_dep_function_true(tmp_path, run_rule, backdate):
     """Test that a recipe is run if a dependency function returns True and
     the target exists.
     """
@@ -40,6 +40,7 @@ def test_dep_function_true(tmp_path, run_rule):
         target="target_true",
     )
 
+    backdate(path_target)
     mtime_first = path_target.stat().st_mtime_ns
 
     run_rule(
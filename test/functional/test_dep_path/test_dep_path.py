@@ -5,7 +5,7 @@ import pytest
 TEST_DIR = pathlib.Path(__file__).parent
 
 
-def test_dep_path(tmp_path, run_rule):
+def test_dep_path(tmp_path, run_rule, backdate):
     """Test that the recipe of a Rule with a Path dependency, that is not the
     target of another rule,
     - is not run if a Path dependency is not updated after the target is
@@ -23,6 +23,7 @@ def test_dep_path(tmp_path, run_rule):
         target="target",
     )
 
+    backdate(path_dep, path_target)
     mtime_first = path_target.stat().st_mtime_ns
 
     run_rule(
@@ -3,7 +3,7 @@ import pathlib
 TEST_DIR = pathlib.Path(__file__).parent
 
 
-def test_dep_rule_path(tmp_path, run_rule):
+def test_dep_rule_path(tmp_path, run_rule, backdate):
     """Test that the recipe of a Rule with a Rule dependency, that has a Path
     as its target,
     - is not run if the Path target of a Rule dependency is not updated after
@@ -19,6 +19,7 @@ def test_dep_rule_path(tmp_path, run_rule):
         target="target",
     )
 
+    backdate(path_dep, path_target)
     mtime_first = path_target.stat().st_mtime_ns
 
     run_rule(
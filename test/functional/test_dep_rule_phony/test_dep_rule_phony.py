@@ -5,7 +5,7 @@ import pytest
 TEST_DIR = pathlib.Path(__file__).parent
 
 
-def test_dep_rule_phony(tmp_path, run_rule):
+def test_dep_rule_phony(tmp_path, run_rule, backdate):
     """Test that a recipe is always run if its rule has a rule dependency with a
     phony target.
     """
@@ -17,6 +17,7 @@ def test_dep_rule_phony(tmp_path, run_rule):
         target="target",
     )
 
+    backdate(path_target)
     mtime_first = path_target.stat().st_mtime_ns
 
     run_rule(
@@ -5,6 +5,8 @@ TEST_DIR = pathlib.Path(__file__).parent
 
 def test_dry_run(tmp_path, run, init_tmp_path):
     """Test that using '--dry-run' causes the recipes not to be run."""
+    # Run in a separate process, as the recipe is printed by a worker process,
+    # which 'run_main' can't capture.
     girdfile = init_tmp_path(pytest_tmp_path=tmp_path, test_dir=TEST_DIR)
 
     path_dep = tmp_path / "dep"
@@ -15,7 +17,7 @@ def test_dry_run(tmp_path, run, init_tmp_path):
     args = [
         "gird",
         "--girdfile",
-        str(girdfile.resolve()),
+        str(girdfile),
         "target",
         "--dry-run",
     ]
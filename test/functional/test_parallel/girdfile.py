@@ -9,36 +9,48 @@ TARGET3 = pathlib.Path("target3")
 TARGET4 = pathlib.Path("target4")
 
 
-def create_target(path: pathlib.Path):
-    """Record current time twice in a file. Use time.sleep() to make sure the
-    same times, with a precision of 0.1 seconds, couldn't be recorded without
-    parallel execution.
+# Maximum time for a recipe to wait for the recipe of the other target to
+# start.
+TIMEOUT = 0.5
+
+
+def create_target(path: pathlib.Path, path_other: pathlib.Path):
+    """Record in a file whether the recipe of another target was running at the
+    same time, i.e., whether the other recipe wasn't done when this one
+    started, but started before this one ended. Wait for the other recipe to
+    start for at most TIMEOUT seconds. Mark the start & the end of the recipe
+    with files for the other recipe to see.
     """
-    print(f"{path} time0.")
-    time0 = time.time()
-    # Make sure the times are different with 0.1 second precision.
-    time.sleep(0.101)
-    print(f"{path} time1.")
-    time1 = time.time()
-    path.write_text(f"{time0}\n{time1}\n")
-    # Make sure the same times won't be recorded in following invocations.
-    time.sleep(0.101)
+    print(f"{path} start.")
+    is_other_done = path_other.with_suffix(".done").exists()
+    path.with_suffix(".started").touch()
+    path_other_started = path_other.with_suffix(".started")
+    overlapped = False
+    time_end = time.monotonic() + TIMEOUT
+    while not is_other_done and time.monotonic() < time_end:
+        if path_other_started.exists():
+            overlapped = True
+            break
+        time.sleep(0.001)
+    print(f"{path} end.")
+    path.write_text(f"{overlapped}\n")
+    path.with_suffix(".done").touch()
 
 
 def create_target1():
-    create_target(TARGET1)
+    create_target(TARGET1, TARGET2)
 
 
 def create_target2():
-    create_target(TARGET2)
+    create_target(TARGET2, TARGET1)
 
 
 def create_target3():
-    create_target(TARGET3)
+    create_target(TARGET3, TARGET4)
 
 
 def create_target4():
-    create_target(TARGET4)
+    create_target(TARGET4, TARGET3)
 
 
 gird.rule(
@@ -1,25 +1,26 @@
+import os
 import pathlib
 
+import pytest
+
 TEST_DIR = pathlib.Path(__file__).parent
 
+# Rules are run in parallel in as many processes as there are CPUs.
+requires_multiple_cpus = pytest.mark.skipif(
+    (os.cpu_count() or 1) < 2,
+    reason="Recipes can't be run in parallel with a single CPU.",
+)
 
-def get_times(path: pathlib.Path) -> set[float]:
-    """Given a file with two timestamps that span a time range, return the
-    timestamps of the range with 0.1 second precision.
-    """
-    time0, time1 = (
-        round(float(line), 1) for line in path.read_text().strip().split("\n")
-    )
-    times = []
-    time = time0
-    while time <= time1:
-        times.append(time)
-        time = round(time + 0.1, 1)
 
-    return set(times)
+def is_overlapped(path: pathlib.Path) -> bool:
+    """Given a target file, return whether its recipe was running at the same
+    time with the recipe of the other target.
+    """
+    return path.read_text() == "True\n"
 
 
-def test_parallel(tmp_path, run, init_tmp_path):
+@requires_multiple_cpus
+def test_parallel(tmp_path, run_main, init_tmp_path):
     """Test that a recipe is by default run in parallel with recipes of other
     rules.
     """
@@ -28,11 +29,11 @@ def test_parallel(tmp_path, run, init_tmp_path):
     args = [
         "gird",
         "--girdfile",
-        str(girdfile.resolve()),
+        str(girdfile),
         "parallel",
     ]
 
-    run(
+    run_main(
         tmp_path,
         args,
     )
@@ -40,30 +41,31 @@ def test_parallel(tmp_path, run, init_tmp_path):
     target1 = tmp_path / "target1"
     target2 = tmp_path / "target2"
 
-    times1 = get_times(target1)
-    times2 = get_times(target2)
-
-    # Test that recorded times overlap.
-    assert len(times1 & times2) > 0
+    # Test that the recipes were running at the same time.
+    assert is_overlapped(target1)
+    assert is_overlapped(target2)
 
     # NOTE For some reason the test below doesn't work on GitHub's runners, and
     #      is therefore disabled. Interspersed output probably isn't anything
     #      that somebody would absolutely desire anyway.
     # Test that output is not buffered, i.e., the recipes' output is not intact.
     # for target in (target1, target2):
-    #     assert f"{target.name} time0.\n{target.name} time1.\n" not in process.stdout
+    #     assert f"{target.name} start.\n{target.name} end.\n" not in process.stdout
 
 
+@requires_multiple_cpus
 def test_parallel_output_sync(tmp_path, run, init_tmp_path):
     """Test that the output of a recipe is buffered with the "--output-sync" CLI
     argument.
     """
+    # Run in a separate process, as the output of the recipes run in parallel
+    # is printed by the worker processes, which 'run_main' can't capture.
     girdfile = init_tmp_path(pytest_tmp_path=tmp_path, test_dir=TEST_DIR)
 
     args = [
         "gird",
         "--girdfile",
-        str(girdfile.resolve()),
+        str(girdfile),
         "--output-sync",
         "parallel",
     ]
@@ -76,18 +78,16 @@ def test_parallel_output_sync(tmp_path, run, init_tmp_path):
     target1 = tmp_path / "target1"
     target2 = tmp_path / "target2"
 
-    times1 = get_times(target1)
-    times2 = get_times(target2)
-
-    # Test that recorded times overlap.
-    assert len(times1 & times2) > 0
+    # Test that the recipes were running at the same time.
+    assert is_overlapped(target1)
+    assert is_overlapped(target2)
 
     # Test that output is buffered, i.e., the recipes' output is intact.
     for target in (target1, target2):
-        assert f"{target.name} time0.\n{target.name} time1.\n" in process.stdout
+        assert f"{target.name} start.\n{target.name} end.\n" in process.stdout
 
 
-def test_parallel_off(tmp_path, run, init_tmp_path):
+def test_parallel_off(tmp_path, run_main, init_tmp_path):
     """Test that a recipe is not run in parallel with recipes of other rules
     when parallel=False.
     """
@@ -96,11 +96,11 @@ def test_parallel_off(tmp_path, run, init_tmp_path):
     args = [
         "gird",
         "--girdfile",
-        str(girdfile.resolve()),
+        str(girdfile),
         "serial",
     ]
 
-    process = run(
+    process = run_main(
         tmp_path,
         args,
     )
@@ -108,12 +108,10 @@ def test_parallel_off(tmp_path, run, init_tmp_path):
     target3 = tmp_path / "target3"
     target4 = tmp_path / "target4"
 
-    times1 = get_times(target3)
-    times2 = get_times(target4)
-
-    # Test that recorded times don't overlap.
-    assert len(times1 & times2) == 0
+    # Test that the recipes weren't running at the same time.
+    assert not is_overlapped(target3)
+    assert not is_overlapped(target4)
 
     # Test that recipes' output is intact.
     for target in (target3, target4):
-        assert f"{target.name} time0.\n{target.name} time1.\n" in process.stdout
+        assert f"{target.name} start.\n{target.name} end.\n" in process.stdout
@@ -0,0 +1,10 @@
+import pathlib
+
+import gird
+
+path_target = pathlib.Path("target")
+
+gird.rule(
+    target=path_target,
+    recipe=[["touch", str(path_target.resolve())]],
+)
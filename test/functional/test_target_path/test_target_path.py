@@ -3,7 +3,7 @@ import pathlib
 TEST_DIR = pathlib.Path(__file__).parent
 
 
-def test_target_path_with_dep(tmp_path, run_rule):
+def test_target_path_with_dep(tmp_path, run_rule, backdate):
     """Test that for a Path target with a Path dependency,
     - the recipe is not run if it's dependency is not updated after the target
       is created, and
@@ -18,6 +18,7 @@ def test_target_path_with_dep(tmp_path, run_rule):
         target="target_with_dep",
     )
 
+    backdate(path_dep, path_target)
     mtime_first = path_target.stat().st_mtime_ns
 
     run_rule(
@@ -3,7 +3,7 @@ import pathlib
 TEST_DIR = pathlib.Path(__file__).parent
 
 
-def test_target_phony(tmp_path, run_rule):
+def test_target_phony(tmp_path, run_rule, backdate):
     """Test that the recipe of a phony target is executed every time the rule
     is invoked.
     """
@@ -15,6 +15,7 @@ def test_target_phony(tmp_path, run_rule):
         target="target",
     )
 
+    backdate(path_result)
     mtime_first = path_result.stat().st_mtime_ns
 
     run_rule(
@@ -3,7 +3,7 @@ import pathlib
 TEST_DIR = pathlib.Path(__file__).parent
 
 
-def test_target_object(tmp_path, run_rule):
+def test_target_object(tmp_path, run_rule, backdate):
     """Test that a custom class implementing the TimeTracked protocol can be
     used as a target.
     """
@@ -17,6 +17,7 @@ def test_target_object(tmp_path, run_rule):
 
     assert target.exists()
 
+    backdate(target)
     mtime_first = target.stat().st_mtime_ns
 
     run_rule(
@@ -0,0 +1,24 @@
+import pathlib
+
+from gird.object import TimeTrackedPath
+
+
+def test_timetracked_path_timestamp_nonexistent(tmp_path):
+    """Test that paths that can't be accessed like existing files have no
+    timestamp.
+    """
+    path_loop = tmp_path / "loop"
+    path_loop.symlink_to(path_loop)
+    path_file = tmp_path / "file"
+    path_file.touch()
+
+    for path in (
+        tmp_path / "nonexistent",
+        path_file / "file",
+        path_loop,
+        tmp_path / ("a" * 1000),
+        pathlib.Path("null\0character"),
+    ):
+        assert TimeTrackedPath(path).timestamp is None
+
+    assert TimeTrackedPath(path_file).timestamp is not None
@@ -49,6 +49,7 @@ def test_type_check():
 
     grule(target=Phony("target"), recipe=["recipe"])
     grule(target=Phony("target"), recipe=[dummy_function_recipe])
+    grule(target=Phony("target"), recipe=[["echo", "1"]])
 
     with pytest.raises(TypeError, match="Invalid recipe type: '1'."):
         grule(target=Phony("target"), recipe=1)
@@ -56,6 +57,9 @@ def test_type_check():
     with pytest.raises(TypeError, match="Invalid recipe type: '1'."):
         grule(target=Phony("target"), recipe=[1])
 
+    with pytest.raises(TypeError, match=r"Invalid recipe type: '\['echo', 1\]'."):
+        grule(target=Phony("target"), recipe=[["echo", 1]])
+
 
 def test_iterators():
     """Test that iterators are properly handled."""
@@ -70,3 +74,26 @@ def test_iterators():
     rule = grule(target=Phony("target"), deps=iter(deps), recipe=iter(recipe))
     assert len(rule.deps) == 2
     assert len(rule.recipe) == 2
+
+
+def test_empty():
+    """Test that omitted deps & recipe are stored as empty tuples."""
+    rule = grule(target=Phony("target"))
+    assert rule.deps == ()
+    assert rule.recipe == ()
+
+
+def test_recipe_argv():
+    """Test that argument lists within a recipe are stored as tuples."""
+    rule = grule(target=Phony("target"), recipe=["echo 1", ["echo", "2"]])
+    assert rule.recipe == ("echo 1", ("echo", "2"))
+
+
+def test_path_sharing():
+    """Test that rules with equal paths share the same TimeTrackedPath."""
+    rule1 = grule(target=pathlib.Path("target1"), deps=pathlib.Path("dep"))
+    rule2 = grule(target=pathlib.Path("target2"), deps=[pathlib.Path("dep")])
+    rule3 = grule(target=Phony("target3"), deps=rule1)
+    assert rule1.deps[0] is rule2.deps[0]
+    assert rule3.deps[0] is rule1.target
+    assert grule(target=pathlib.Path("target1")).target is rule1.target
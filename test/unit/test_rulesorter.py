@@ -0,0 +1,136 @@
+import graphlib
+import sys
+import threading
+
+import pytest
+
+from gird import Phony
+from gird.rule import rule as grule
+from gird.rulesorter import build_target_graph
+
+
+def test_build_target_graph_shared_dep():
+    """Test that a Rule shared by multiple dependents is visited only once."""
+    calls = []
+
+    def function_dep():
+        calls.append(None)
+        return False
+
+    rule_shared = grule(target=Phony("shared"), deps=function_dep)
+    rule_left = grule(target=Phony("left"), deps=rule_shared)
+    rule_right = grule(target=Phony("right"), deps=rule_shared)
+    rule_top = grule(target=Phony("top"), deps=[rule_left, rule_right])
+
+    rules = [rule_shared, rule_left, rule_right, rule_top]
+    map_target_rule = {rule.target.id: rule for rule in rules}
+
+    graph = build_target_graph(map_target_rule, rule_top.target)
+
+    assert len(calls) == 1
+    assert graph == {
+        "shared": set(),
+        "left": {"shared"},
+        "right": {"shared"},
+        "top": {"left", "right"},
+    }
+
+
+def test_build_target_graph_long_chain():
+    """Test that a chain of dependencies longer than the recursion limit works."""
+    chain_length = sys.getrecursionlimit() + 1
+    rules = [grule(target=Phony("target0"))]
+    for i in range(1, chain_length):
+        rules.append(grule(target=Phony(f"target{i}"), deps=rules[-1]))
+    map_target_rule = {rule.target.id: rule for rule in rules}
+
+    graph = build_target_graph(map_target_rule, rules[-1].target)
+
+    assert len(graph) == chain_length
+
+
+def test_build_target_graph_cycle():
+    """Test that a cycle in the dependencies raises a CycleError."""
+    target1 = Phony("target1")
+    target2 = Phony("target2")
+    rules = [
+        grule(target=target1, deps=target2),
+        grule(target=target2, deps=target1),
+    ]
+    map_target_rule = {rule.target.id: rule for rule in rules}
+
+    with pytest.raises(graphlib.CycleError):
+        build_target_graph(map_target_rule, target1)
+
+
+def test_build_target_graph_function_deps_main_thread():
+    """Test that function dependencies are by default called in the main
+    thread.
+    """
+    threads = []
+
+    def function_dep():
+        threads.append(threading.current_thread())
+        return False
+
+    def function_dep_other():
+        threads.append(threading.current_thread())
+        return False
+
+    rule = grule(target=Phony("target"), deps=[function_dep, function_dep_other])
+
+    build_target_graph({"target": rule}, rule.target)
+
+    assert threads == [threading.main_thread()] * 2
+
+
+def test_build_target_graph_function_deps_order():
+    """Test that function dependencies are by default called depth-first in the
+    order they're encountered in, and not before an invalid dependency is found.
+    """
+    calls = []
+
+    def function_dep1():
+        calls.append(1)
+        return False
+
+    def function_dep2():
+        calls.append(2)
+        return False
+
+    rule_dep = grule(target=Phony("dep"), deps=function_dep2)
+    rule = grule(target=Phony("target"), deps=[rule_dep, function_dep1])
+    map_target_rule = {"dep": rule_dep, "target": rule}
+
+    build_target_graph(map_target_rule, rule.target)
+
+    assert calls == [2, 1]
+
+    calls.clear()
+    rule = grule(target=Phony("target"), deps=[Phony("nonexistent"), function_dep1])
+
+    with pytest.raises(TypeError):
+        build_target_graph({"target": rule}, rule.target)
+
+    assert calls == []
+
+
+def test_build_target_graph_concurrent_function_deps():
+    """Test that function dependencies are called concurrently with
+    concurrent_deps=True.
+    """
+    barrier = threading.Barrier(2, timeout=5)
+
+    def function_dep():
+        barrier.wait()
+        return True
+
+    def function_dep_other():
+        barrier.wait()
+        return False
+
+    rule = grule(target=Phony("target"), deps=[function_dep, function_dep_other])
+
+    graph = build_target_graph({"target": rule}, rule.target, concurrent_deps=True)
+
+    assert graph == {"target": set()}
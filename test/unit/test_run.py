@@ -0,0 +1,88 @@
+import contextlib
+import io
+
+import pytest
+
+from gird import Phony
+from gird.rule import rule as grule
+from gird.run import get_command_args, run_rule, run_subrecipe
+
+
+def test_get_command_args():
+    """Test that only simple commands are run without a shell."""
+    assert get_command_args("touch file1 file2") == ["touch", "file1", "file2"]
+    assert get_command_args("echo 'text' > file") is None
+    assert get_command_args("exit 1") is None
+    assert get_command_args("VARIABLE=1 env") is None
+    assert get_command_args("nonexistent_executable") is None
+    assert get_command_args("echo -e text") is None
+    assert get_command_args("time touch file") is None
+    assert get_command_args("touch file1\u00a0file2") is None
+    assert get_command_args("touch file1\rfile2") is None
+    assert get_command_args("touch\tfile1  file2") == ["touch", "file1", "file2"]
+
+
+def test_run_subrecipe_signal(tmp_path, monkeypatch):
+    """Test that a simple command terminated by a signal is an error."""
+    path_script = tmp_path / "kill.sh"
+    path_script.write_text("#!/bin/sh\nkill -9 $$\n")
+    path_script.chmod(0o755)
+    monkeypatch.chdir(tmp_path)
+
+    with pytest.raises(RuntimeError, match="terminated by signal SIGKILL"):
+        run_subrecipe("./kill.sh")
+
+
+def test_run_subrecipe_argv_signal():
+    """Test that an argument list command terminated by a signal is an error."""
+    with pytest.raises(RuntimeError, match="terminated by signal SIGKILL"):
+        run_subrecipe(("sh", "-c", "kill -9 $$"))
+
+
+def test_run_subrecipe_script_without_shebang(tmp_path, monkeypatch, capfd):
+    """Test that an executable script without a shebang line is run by the
+    shell.
+    """
+    path_script = tmp_path / "noshebang.sh"
+    path_script.write_text("echo from-script\n")
+    path_script.chmod(0o755)
+    monkeypatch.chdir(tmp_path)
+
+    run_subrecipe("./noshebang.sh")
+
+    assert capfd.readouterr().out == "from-script\n"
+
+
+def test_run_rule_output_sync(capfd):
+    """Test that the output of both commands & functions is printed in order
+    with output_sync, also when the recipe fails.
+    """
+    rule = grule(
+        target=Phony("target"),
+        recipe=["echo 1", lambda: print(2), ["echo", "3"], "echo 4 >&2"],
+    )
+    run_rule(rule, output_sync=True)
+    assert capfd.readouterr().out == "1\n2\n3\n4\n"
+
+    rule = grule(target=Phony("target"), recipe=["echo 1", "exit 1"])
+    with pytest.raises(RuntimeError, match="exited with error code 1"):
+        run_rule(rule, output_sync=True)
+    assert capfd.readouterr().out == "1\n"
+
+
+def test_run_rule_output_sync_undecodable(capfdbinary):
+    """Test that output that can't be decoded is printed as it is with
+    output_sync, in order with the output of functions.
+    """
+    rule = grule(
+        target=Phony("target"),
+        recipe=["printf '\\351t\\351\\n'", lambda: print("text")],
+    )
+    run_rule(rule, output_sync=True)
+    assert capfdbinary.readouterr().out == b"\xe9t\xe9\ntext\n"
+
+    # Decode the output if stdout has no binary buffer.
+    stdout = io.StringIO()
+    with contextlib.redirect_stdout(stdout):
+        run_rule(rule, output_sync=True)
+    assert stdout.getvalue() == "\\xe9t\\xe9\ntext\n"